@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Literal
 from uuid import UUID
 
+import aiofiles
 from fastapi import APIRouter, BackgroundTasks, Header, HTTPException, Query, status
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
@@ -324,8 +325,8 @@ async def generate_story_audio_system(
         # Ensure dir exists
         settings.ensure_directories()
 
-        with open(file_path, "wb") as f:
-            f.write(audio_bytes)
+        async with aiofiles.open(file_path, "wb") as f:
+            await f.write(audio_bytes)
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
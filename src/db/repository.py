@@ -1,5 +1,6 @@
 """Database repository with CRUD operations for StoryBuddy entities."""
 
+import json
 from datetime import datetime
 from uuid import UUID, uuid4
 
@@ -379,8 +380,6 @@ class StoryRepository:
     @staticmethod
     async def create(data: StoryCreate) -> Story:
         """Create a new story."""
-        import json
-
         story_id = str(uuid4())
         now = datetime.utcnow().isoformat()
         word_count = Story.calculate_word_count(data.content)
@@ -429,8 +428,6 @@ class StoryRepository:
     @staticmethod
     async def get_by_id(story_id: UUID) -> Story | None:
         """Get a story by ID."""
-        import json
-
         async with get_db_connection() as db:
             cursor = await db.execute(
                 "SELECT * FROM story WHERE id = ?",
@@ -470,8 +467,6 @@ class StoryRepository:
         offset: int = 0,
     ) -> tuple[list[Story], int]:
         """Get all stories for a parent with pagination."""
-        import json
-
         async with get_db_connection() as db:
             # Build query with optional source filter
             where_clause = "WHERE parent_id = ?"
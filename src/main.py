@@ -9,6 +9,7 @@ from contextlib import asynccontextmanager
 from typing import Any
 from uuid import uuid4
 
+import orjson
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -16,6 +17,9 @@ from fastapi.responses import JSONResponse
 from src.api import parents, qa, questions, stories, voice, voice_routes
 from src.config import get_settings
 from src.db.init import init_database
+from src.services.llm import get_claude_service
+from src.services.qa_handler import get_qa_service
+from src.services.story_generator import get_story_service
 
 # Configure structured logging
 settings = get_settings()
@@ -48,7 +52,12 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        try:
+            return orjson.dumps(log_data).decode()
+        except TypeError:
+            # orjson raises TypeError on anything it cannot encode, such as lone
+            # surrogates or integers wider than 64 bits; json handles both
+            return json.dumps(log_data)
 
 
 def setup_logging() -> logging.Logger:
@@ -92,6 +101,9 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("Shutting down StoryBuddy API...")
+    await get_claude_service().aclose()
+    await get_qa_service().aclose()
+    await get_story_service().aclose()
 
 
 app = FastAPI(
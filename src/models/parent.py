@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ParentBase(BaseModel):
@@ -35,7 +35,7 @@ class Parent(ParentBase):
         default_factory=datetime.utcnow, description="Last update timestamp"
     )
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ParentResponse(Parent):
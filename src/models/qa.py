@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.models import MessageRole, QASessionStatus
 
@@ -31,7 +31,7 @@ class QASession(BaseModel):
     message_count: int = Field(default=0, le=10, description="Number of messages in session")
     status: QASessionStatus = Field(default=QASessionStatus.ACTIVE, description="Session status")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QASessionResponse(QASession):
@@ -71,7 +71,7 @@ class QAMessage(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation time")
     sequence: int = Field(..., description="Message sequence number")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QAMessageResponse(QAMessage):
@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.config import get_settings
 from src.models import StorySource
@@ -23,37 +23,21 @@ class StoryCreate(StoryBase):
 
     parent_id: UUID = Field(..., description="Parent ID who owns this story")
     source: StorySource = Field(..., description="Story source (imported or ai_generated)")
+    content: str = Field(
+        ...,
+        max_length=settings.max_story_word_count,
+        description="Story content text",
+    )
     keywords: list[str] | None = Field(
         None, description="Keywords used to generate the story (for AI-generated)"
     )
 
-    @field_validator("content")
-    @classmethod
-    def validate_word_count(cls, v: str) -> str:
-        """Validate that content does not exceed max word count."""
-        word_count = len(v)
-        if word_count > settings.max_story_word_count:
-            msg = f"Story content exceeds maximum of {settings.max_story_word_count} characters"
-            raise ValueError(msg)
-        return v
-
 
 class StoryUpdate(BaseModel):
     """Model for updating a story."""
 
     title: str | None = Field(None, max_length=200)
-    content: str | None = None
-
-    @field_validator("content")
-    @classmethod
-    def validate_word_count(cls, v: str | None) -> str | None:
-        """Validate that content does not exceed max word count."""
-        if v is not None:
-            word_count = len(v)
-            if word_count > settings.max_story_word_count:
-                msg = f"Story content exceeds maximum of {settings.max_story_word_count} characters"
-                raise ValueError(msg)
-        return v
+    content: str | None = Field(None, max_length=settings.max_story_word_count)
 
 
 class Story(StoryBase):
@@ -72,7 +56,7 @@ class Story(StoryBase):
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
     updated_at: datetime = Field(default_factory=datetime.utcnow, description="Update timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
     @staticmethod
     def calculate_word_count(content: str) -> int:
@@ -1,9 +1,10 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, Literal
+from typing import Literal
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, with_config
+from typing_extensions import TypedDict
 
 from src.models import VoiceProfileStatus
 
@@ -71,7 +72,7 @@ class VoiceProfile(VoiceProfileBase):
         default_factory=datetime.utcnow, description="Last update timestamp"
     )
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class VoiceProfileResponse(VoiceProfile):
@@ -108,7 +109,7 @@ class VoiceAudio(VoiceAudioBase):
     format: Literal["wav", "mp3", "m4a"]
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Request/Response models for API
@@ -125,6 +126,26 @@ class VoicePreviewResponse(BaseModel):
     duration_seconds: float = Field(..., description="Audio duration")
 
 
+@with_config(ConfigDict(extra="allow"))
+class SSMLOptions(TypedDict, total=False):
+    """Provider synthesis options attached to a voice character.
+
+    Declared as a TypedDict so pydantic-core validates the known keys natively
+    while providers keep receiving a plain dict. Undeclared keys are kept and
+    passed through to the provider untouched.
+    """
+
+    language: str
+    style: str | float  # Azure speaking style, or ElevenLabs style weight
+    role: str
+    pitch: str
+    rate: str | float
+    volume: str
+    model_id: str
+    stability: float
+    similarity_boost: float
+
+
 class VoiceCharacter(BaseModel):
     """Individual voice/character within a kit."""
 
@@ -132,7 +153,7 @@ class VoiceCharacter(BaseModel):
     kit_id: str = Field(..., description="Parent kit ID")
     name: str = Field(..., max_length=50, description="Character name")
     provider_voice_id: str = Field(..., description="Provider's voice ID")
-    ssml_options: dict[str, Any] | None = Field(None, description="SSML customization options")
+    ssml_options: SSMLOptions | None = Field(None, description="SSML customization options")
     gender: Gender
     age_group: AgeGroup
     style: VoiceStyle
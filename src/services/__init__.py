@@ -1,5 +1,25 @@
 """Business logic services for StoryBuddy."""
 
-from src.services.llm import ClaudeService, get_claude_service
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.services.llm import ClaudeService, get_claude_service
+
+# Resolved on first access (PEP 562) so importing one service submodule does
+# not pull in every provider SDK.
+_LAZY_IMPORTS = {
+    "ClaudeService": "src.services.llm",
+    "get_claude_service": "src.services.llm",
+}
 
 __all__ = ["ClaudeService", "get_claude_service"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
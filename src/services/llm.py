@@ -1,14 +1,30 @@
 """Claude LLM service for story generation and Q&A."""
 
+import asyncio
+import hashlib
 import logging
+import re
+from collections import OrderedDict
+from collections.abc import Hashable
 from dataclasses import dataclass
+from typing import Generic, TypeVar
 
 import anthropic
+import orjson
 
 from src.config import get_settings
 
 logger = logging.getLogger("storybuddy")
 
+# Markdown code fence Claude sometimes wraps its JSON output in
+_JSON_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# Maximum number of responses kept per exact-match response cache
+RESPONSE_CACHE_SIZE = 512
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
 # System prompts
 STORY_GENERATION_SYSTEM_PROMPT = """You are a creative children's story writer.
 Your task is to write engaging, age-appropriate stories for children aged 3-8 years old.
@@ -47,7 +63,7 @@ You must respond with a JSON object containing:
 Do not include any other text outside the JSON object."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StoryGenerationResult:
     """Result of story generation."""
 
@@ -55,7 +71,7 @@ class StoryGenerationResult:
     content: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QAResult:
     """Result of Q&A response."""
 
@@ -63,6 +79,31 @@ class QAResult:
     is_in_scope: bool
 
 
+class _ResponseCache(Generic[K, V]):
+    """Bounded exact-match LRU cache for Claude responses."""
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, V] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for key, marking it as recently used."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class ClaudeService:
     """Service for interacting with Claude API."""
 
@@ -70,17 +111,34 @@ class ClaudeService:
         """Initialize Claude client."""
         settings = get_settings()
         self.api_key = settings.anthropic_api_key
-        self._client: anthropic.Anthropic | None = None
+        self._client: anthropic.AsyncAnthropic | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        # Children often repeat keyword sets and questions; serve repeats from memory
+        self._story_cache: _ResponseCache[tuple[str, ...], StoryGenerationResult] = _ResponseCache()
+        self._qa_cache: _ResponseCache[tuple[str, str], QAResult] = _ResponseCache()
 
     @property
-    def client(self) -> anthropic.Anthropic:
-        """Get or create Anthropic client."""
-        if self._client is None:
+    def client(self) -> anthropic.AsyncAnthropic:
+        """Get or create async Anthropic client.
+
+        Pooled connections belong to the event loop they were opened on, so a
+        new client is created when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed() or self._client_loop is not loop:
             if not self.api_key:
                 raise ValueError("ANTHROPIC_API_KEY is not configured")
-            self._client = anthropic.Anthropic(api_key=self.api_key)
+            self._client = anthropic.AsyncAnthropic(api_key=self.api_key)
+            self._client_loop = loop
         return self._client
 
+    async def aclose(self) -> None:
+        """Close the Anthropic client and its pooled connections."""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.close()
+        self._client = None
+        self._client_loop = None
+
     async def generate_story(self, keywords: list[str]) -> StoryGenerationResult:
         """Generate a children's story based on keywords.
 
@@ -90,13 +148,20 @@ class ClaudeService:
         Returns:
             StoryGenerationResult with title and content
         """
+        # Keyword order shapes the prompt and fallback title, so it is part of the key
+        cache_key = tuple(keywords)
+        cached = self._story_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Returning cached story for keywords: %s", keywords)
+            return cached
+
         keywords_str = "、".join(keywords)
         user_prompt = f"請根據以下關鍵字創作一個兒童故事：{keywords_str}"
 
-        logger.info(f"Generating story with keywords: {keywords}")
+        logger.info("Generating story with keywords: %s", keywords)
 
         try:
-            message = self.client.messages.create(
+            message = await self.client.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=2000,
                 system=STORY_GENERATION_SYSTEM_PROMPT,
@@ -108,26 +173,18 @@ class ClaudeService:
             if not hasattr(first_block, "text"):
                 raise RuntimeError("Unexpected response format from Claude API")
             response_text: str = first_block.text
-            logger.debug(f"Claude response: {response_text}")
+            logger.debug("Claude response: %s", response_text)
 
             # Parse JSON response (handle markdown code blocks)
-            import json
-            import re
-
-            # Remove markdown code blocks if present
             json_text = response_text
-            json_match = re.search(r"```(?:json)?\s*(.*?)```", response_text, re.DOTALL)
+            json_match = _JSON_FENCE_PATTERN.search(response_text)
             if json_match:
                 json_text = json_match.group(1).strip()
 
             try:
-                result = json.loads(json_text)
-                return StoryGenerationResult(
-                    title=result.get("title", f"故事：{keywords_str}"),
-                    content=result.get("content", response_text),
-                )
-            except json.JSONDecodeError:
-                # If not valid JSON, use the response as content
+                data = orjson.loads(json_text)
+            except orjson.JSONDecodeError:
+                # If not valid JSON, use the response as content; not cached so a retry can recover
                 logger.warning("Claude response was not valid JSON, using raw text")
                 return StoryGenerationResult(
                     title=f"故事：{keywords_str}",
@@ -135,9 +192,16 @@ class ClaudeService:
                 )
 
         except anthropic.APIError as e:
-            logger.error(f"Claude API error: {e}")
+            logger.error("Claude API error: %s", e)
             raise RuntimeError(f"Failed to generate story: {e}") from e
 
+        result = StoryGenerationResult(
+            title=data.get("title", f"故事：{keywords_str}"),
+            content=data.get("content", response_text),
+        )
+        self._story_cache.put(cache_key, result)
+        return result
+
     async def answer_question(self, story_content: str, question: str) -> QAResult:
         """Answer a child's question about a story.
 
@@ -148,6 +212,12 @@ class ClaudeService:
         Returns:
             QAResult with answer and is_in_scope flag
         """
+        cache_key = (hashlib.sha256(story_content.encode()).hexdigest(), question.strip())
+        cached = self._qa_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Returning cached answer for question: %s...", question[:50])
+            return cached
+
         user_prompt = f"""故事內容：
 {story_content}
 
@@ -155,10 +225,10 @@ class ClaudeService:
 
 小朋友的問題：{question}"""
 
-        logger.info(f"Answering question: {question[:50]}...")
+        logger.info("Answering question: %s...", question[:50])
 
         try:
-            message = self.client.messages.create(
+            message = await self.client.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=500,
                 system=QA_SYSTEM_PROMPT,
@@ -169,25 +239,17 @@ class ClaudeService:
             if not hasattr(first_block, "text"):
                 raise RuntimeError("Unexpected response format from Claude API")
             response_text: str = first_block.text
-            logger.debug(f"Claude Q&A response: {response_text}")
+            logger.debug("Claude Q&A response: %s", response_text)
 
             # Parse JSON response (handle markdown code blocks)
-            import json
-            import re
-
-            # Remove markdown code blocks if present
             json_text = response_text
-            json_match = re.search(r"```(?:json)?\s*(.*?)```", response_text, re.DOTALL)
+            json_match = _JSON_FENCE_PATTERN.search(response_text)
             if json_match:
                 json_text = json_match.group(1).strip()
 
             try:
-                result = json.loads(json_text)
-                return QAResult(
-                    answer=result.get("answer", response_text),
-                    is_in_scope=result.get("is_in_scope", True),
-                )
-            except json.JSONDecodeError:
+                data = orjson.loads(json_text)
+            except orjson.JSONDecodeError:
                 logger.warning("Claude Q&A response was not valid JSON")
                 return QAResult(
                     answer=response_text,
@@ -195,9 +257,16 @@ class ClaudeService:
                 )
 
         except anthropic.APIError as e:
-            logger.error(f"Claude API error in Q&A: {e}")
+            logger.error("Claude API error in Q&A: %s", e)
             raise RuntimeError(f"Failed to answer question: {e}") from e
 
+        result = QAResult(
+            answer=data.get("answer", response_text),
+            is_in_scope=data.get("is_in_scope", True),
+        )
+        self._qa_cache.put(cache_key, result)
+        return result
+
 
 # Singleton instance
 _claude_service: ClaudeService | None = None
@@ -6,6 +6,8 @@ This service handles:
 - Child-friendly response generation
 """
 
+import asyncio
+import json
 import logging
 
 import httpx
@@ -19,6 +21,20 @@ settings = get_settings()
 # Claude API endpoint
 ANTHROPIC_API_BASE = "https://api.anthropic.com/v1"
 
+# Keywords suggesting a question is outside the story (used by the fallback)
+OUT_OF_SCOPE_KEYWORDS = (
+    "為什麼天空",
+    "恐龍",
+    "太空",
+    "地球",
+    "科學",
+    "數學",
+    "學校",
+    "爸爸媽媽",
+    "真的嗎",
+    "現實",
+)
+
 
 class QAHandlerError(Exception):
     """Exception raised for Q&A handler errors."""
@@ -59,6 +75,28 @@ class QAHandlerService:
         self.api_key = api_key or settings.anthropic_api_key
         if not self.api_key:
             logger.warning("Anthropic API key not configured")
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client, reused so connections stay alive.
+
+        Pooled connections belong to the event loop they were opened on, so a
+        new client is created when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
 
     def _get_headers(self) -> dict[str, str]:
         """Get HTTP headers for API requests."""
@@ -133,42 +171,34 @@ class QAHandlerService:
             # Return a fallback response when API is not configured
             return self._get_fallback_response(question)
 
-        messages = []
+        # Conversation history (if any) followed by the current question
+        messages = [*(conversation_history or ()), {"role": "user", "content": question}]
 
-        # Add conversation history if provided
-        if conversation_history:
-            for msg in conversation_history:
-                messages.append(msg)
+        try:
+            response = await self.client.post(
+                f"{ANTHROPIC_API_BASE}/messages",
+                headers=self._get_headers(),
+                json={
+                    "model": "claude-sonnet-4-20250514",
+                    "max_tokens": 500,
+                    "system": self._build_system_prompt(story),
+                    "messages": messages,
+                },
+            )
 
-        # Add the current question
-        messages.append({"role": "user", "content": question})
+            if response.status_code == 200:
+                result = response.json()
+                content = result.get("content", [])
 
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{ANTHROPIC_API_BASE}/messages",
-                    headers=self._get_headers(),
-                    json={
-                        "model": "claude-sonnet-4-20250514",
-                        "max_tokens": 500,
-                        "system": self._build_system_prompt(story),
-                        "messages": messages,
-                    },
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result.get("content", [])
-
-                    if content and len(content) > 0:
-                        text = content[0].get("text", "")
-                        return self._parse_response(text)
-                    else:
-                        return self._get_fallback_response(question)
+                if content and len(content) > 0:
+                    text = content[0].get("text", "")
+                    return self._parse_response(text)
                 else:
-                    error_detail = response.text
-                    logger.error(f"Claude API error: {response.status_code} - {error_detail}")
                     return self._get_fallback_response(question)
+            else:
+                error_detail = response.text
+                logger.error(f"Claude API error: {response.status_code} - {error_detail}")
+                return self._get_fallback_response(question)
 
         except httpx.RequestError as e:
             logger.error(f"Request error during Q&A: {e}")
@@ -183,8 +213,6 @@ class QAHandlerService:
         Returns:
             QAResponse object
         """
-        import json
-
         try:
             # Try to extract JSON from the response
             # Claude might wrap it in markdown code blocks
@@ -227,20 +255,7 @@ class QAHandlerService:
         question_lower = question.lower()
 
         # Check if it's likely an out-of-scope question
-        out_of_scope_keywords = [
-            "為什麼天空",
-            "恐龍",
-            "太空",
-            "地球",
-            "科學",
-            "數學",
-            "學校",
-            "爸爸媽媽",
-            "真的嗎",
-            "現實",
-        ]
-
-        is_out_of_scope = any(kw in question_lower for kw in out_of_scope_keywords)
+        is_out_of_scope = any(kw in question_lower for kw in OUT_OF_SCOPE_KEYWORDS)
 
         if is_out_of_scope:
             return QAResponse(
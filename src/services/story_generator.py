@@ -6,7 +6,11 @@ This service handles:
 - Story formatting for TTS
 """
 
+import asyncio
+import json
 import logging
+import re
+from functools import lru_cache
 from typing import Literal
 
 import httpx
@@ -19,6 +23,73 @@ settings = get_settings()
 # Claude API endpoint
 ANTHROPIC_API_BASE = "https://api.anthropic.com/v1"
 
+# Keywords that make generated content unsafe for children
+UNSAFE_KEYWORDS = (
+    "殺",
+    "死亡",
+    "血",
+    "暴力",
+    "恐怖",
+    "害怕",
+    "噩夢",
+    "鬼",
+    "妖怪",
+    "武器",
+    "槍",
+    "刀",
+    "戰爭",
+    "打架",
+    "欺負",
+    "霸凌",
+)
+_UNSAFE_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, UNSAFE_KEYWORDS)), re.IGNORECASE)
+
+
+@lru_cache(maxsize=16)
+def _render_system_prompt(age_group: str, target_word_count: int) -> str:
+    """Render the story generation system prompt.
+
+    The prompt depends only on the age group and target length, so it is
+    rendered once per combination and reused across requests and retries.
+    """
+    age_guidance = {
+        "3-5": "使用非常簡單的詞彙，句子要短，重複的元素有助記憶，避免複雜的情節。",
+        "4-6": "使用簡單清晰的語言，可以有簡單的冒險情節，加入有趣的對話。",
+        "7-10": "可以使用較豐富的詞彙，情節可以更複雜，加入一些道德寓意。",
+    }
+
+    return f"""你是一個專業的兒童故事作家，專門為{age_group}歲的小朋友創作故事。
+
+## 你的任務
+根據提供的關鍵字，創作一個適合兒童的中文故事。
+
+## 故事要求
+1. 故事長度約 {target_word_count} 字（可以有10%的誤差）
+2. {age_guidance.get(age_group, age_guidance["4-6"])}
+3. 故事必須有清楚的開始、中間和結束
+4. 主角要有名字和個性
+5. 故事要有正面的訊息（友誼、勇氣、善良等）
+6. 避免任何暴力、恐怖、負面的內容
+7. 故事要適合用語音朗讀（避免太多插入語）
+
+## 安全規則（絕對不可違反）
+- 不可包含任何暴力內容
+- 不可包含任何恐怖元素
+- 不可包含任何歧視性內容
+- 不可包含任何不適合兒童的話題
+- 角色之間要和平相處，即使有衝突也要友善解決
+
+## 回應格式
+你必須以 JSON 格式回應，包含以下欄位：
+- "title": 故事標題（簡短吸引人）
+- "content": 故事內容（完整故事文字）
+
+## 注意事項
+- 使用繁體中文
+- 標點符號要正確
+- 故事要連貫流暢
+- 適合大聲朗讀"""
+
 
 class StoryGeneratorError(Exception):
     """Exception raised for story generation errors."""
@@ -59,6 +130,28 @@ class StoryGeneratorService:
         self.api_key = api_key or settings.anthropic_api_key
         if not self.api_key:
             logger.warning("Anthropic API key not configured")
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client, reused so connections stay alive.
+
+        Pooled connections belong to the event loop they were opened on, so a
+        new client is created when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=60.0)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
 
     def _get_headers(self) -> dict[str, str]:
         """Get HTTP headers for API requests."""
@@ -82,43 +175,7 @@ class StoryGeneratorService:
         Returns:
             System prompt string
         """
-        age_guidance = {
-            "3-5": "使用非常簡單的詞彙，句子要短，重複的元素有助記憶，避免複雜的情節。",
-            "4-6": "使用簡單清晰的語言，可以有簡單的冒險情節，加入有趣的對話。",
-            "7-10": "可以使用較豐富的詞彙，情節可以更複雜，加入一些道德寓意。",
-        }
-
-        return f"""你是一個專業的兒童故事作家，專門為{age_group}歲的小朋友創作故事。
-
-## 你的任務
-根據提供的關鍵字，創作一個適合兒童的中文故事。
-
-## 故事要求
-1. 故事長度約 {target_word_count} 字（可以有10%的誤差）
-2. {age_guidance.get(age_group, age_guidance["4-6"])}
-3. 故事必須有清楚的開始、中間和結束
-4. 主角要有名字和個性
-5. 故事要有正面的訊息（友誼、勇氣、善良等）
-6. 避免任何暴力、恐怖、負面的內容
-7. 故事要適合用語音朗讀（避免太多插入語）
-
-## 安全規則（絕對不可違反）
-- 不可包含任何暴力內容
-- 不可包含任何恐怖元素
-- 不可包含任何歧視性內容
-- 不可包含任何不適合兒童的話題
-- 角色之間要和平相處，即使有衝突也要友善解決
-
-## 回應格式
-你必須以 JSON 格式回應，包含以下欄位：
-- "title": 故事標題（簡短吸引人）
-- "content": 故事內容（完整故事文字）
-
-## 注意事項
-- 使用繁體中文
-- 標點符號要正確
-- 故事要連貫流暢
-- 適合大聲朗讀"""
+        return _render_system_prompt(age_group, target_word_count)
 
     async def generate_story(
         self,
@@ -149,31 +206,30 @@ class StoryGeneratorService:
         user_message = f"請用以下關鍵字創作一個故事：{keywords_str}"
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{ANTHROPIC_API_BASE}/messages",
-                    headers=self._get_headers(),
-                    json={
-                        "model": "claude-sonnet-4-20250514",
-                        "max_tokens": 2000,
-                        "system": self._build_system_prompt(age_group, target_word_count),
-                        "messages": [{"role": "user", "content": user_message}],
-                    },
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result.get("content", [])
-
-                    if content and len(content) > 0:
-                        text = content[0].get("text", "")
-                        return self._parse_response(text)
-                    else:
-                        raise StoryGeneratorError("Empty response from Claude")
+            response = await self.client.post(
+                f"{ANTHROPIC_API_BASE}/messages",
+                headers=self._get_headers(),
+                json={
+                    "model": "claude-sonnet-4-20250514",
+                    "max_tokens": 2000,
+                    "system": self._build_system_prompt(age_group, target_word_count),
+                    "messages": [{"role": "user", "content": user_message}],
+                },
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                content = result.get("content", [])
+
+                if content and len(content) > 0:
+                    text = content[0].get("text", "")
+                    return self._parse_response(text)
                 else:
-                    error_detail = response.text
-                    logger.error(f"Claude API error: {response.status_code} - {error_detail}")
-                    raise StoryGeneratorError(f"Story generation failed: {response.status_code}")
+                    raise StoryGeneratorError("Empty response from Claude")
+            else:
+                error_detail = response.text
+                logger.error(f"Claude API error: {response.status_code} - {error_detail}")
+                raise StoryGeneratorError(f"Story generation failed: {response.status_code}")
 
         except httpx.RequestError as e:
             logger.error(f"Request error during story generation: {e}")
@@ -191,8 +247,6 @@ class StoryGeneratorService:
         Raises:
             StoryGeneratorError: If parsing fails
         """
-        import json
-
         try:
             # Try to extract JSON from the response
             json_text = text
@@ -235,31 +289,10 @@ class StoryGeneratorService:
         Returns:
             True if content is safe
         """
-        # List of unsafe keywords to check
-        unsafe_keywords = [
-            "殺",
-            "死亡",
-            "血",
-            "暴力",
-            "恐怖",
-            "害怕",
-            "噩夢",
-            "鬼",
-            "妖怪",
-            "武器",
-            "槍",
-            "刀",
-            "戰爭",
-            "打架",
-            "欺負",
-            "霸凌",
-        ]
-
-        content_lower = content.lower()
-        for keyword in unsafe_keywords:
-            if keyword in content_lower:
-                logger.warning(f"Unsafe keyword found in content: {keyword}")
-                return False
+        match = _UNSAFE_KEYWORD_PATTERN.search(content)
+        if match:
+            logger.warning(f"Unsafe keyword found in content: {match.group()}")
+            return False
 
         return True
 
@@ -284,7 +317,7 @@ async def generate_story_from_keywords(
     Raises:
         StoryGeneratorError: If generation fails after all retries
     """
-    service = StoryGeneratorService()
+    service = get_story_service()
 
     for attempt in range(max_retries):
         try:
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 import azure.cognitiveservices.speech as speechsdk
@@ -48,7 +50,7 @@ class AzureTTSProvider(TTSProvider):
             return False
 
     async def synthesize(
-        self, text: str, voice_id: str, options: dict[str, Any] | None = None
+        self, text: str, voice_id: str, options: Mapping[str, Any] | None = None
     ) -> bytes:
         """
         Synthesize text using Azure TTS.
@@ -101,7 +103,8 @@ class AzureTTSProvider(TTSProvider):
             audio_config=None,  # None means do not play to speaker, just generate
         )
 
-        result = synthesizer.speak_ssml_async(ssml).get()
+        # The SDK future blocks on get(); wait for it off the event loop
+        result = await asyncio.to_thread(synthesizer.speak_ssml_async(ssml).get)
 
         if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
             self.logger.info(
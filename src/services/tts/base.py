@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Any
 
 from src.models.voice import TTSProvider as TTSProviderEnum
@@ -15,7 +16,7 @@ class TTSProvider(ABC):
 
     @abstractmethod
     async def synthesize(
-        self, text: str, voice_id: str, options: dict[str, Any] | None = None
+        self, text: str, voice_id: str, options: Mapping[str, Any] | None = None
     ) -> bytes:
         """
         Synthesize text to audio.
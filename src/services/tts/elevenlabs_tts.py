@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 from elevenlabs import VoiceSettings
@@ -39,7 +41,7 @@ class ElevenLabsProvider(TTSProvider):
             return False
 
     async def synthesize(
-        self, text: str, voice_id: str, options: dict[str, Any] | None = None
+        self, text: str, voice_id: str, options: Mapping[str, Any] | None = None
     ) -> bytes:
         if not self.client:
             raise RuntimeError("ElevenLabs client is not initialized.")
@@ -61,7 +63,7 @@ class ElevenLabsProvider(TTSProvider):
 
         self.logger.info(f"Synthesizing with ElevenLabs: {voice_id} (Model: {model_id})")
 
-        try:
+        def generate() -> bytes:
             # ElevenLabs generate returns a generator of bytes (stream)
             # We consume it all for now.
             audio_generator = self.client.generate(
@@ -75,9 +77,11 @@ class ElevenLabsProvider(TTSProvider):
                     use_speaker_boost=True,
                 ),
             )
+            return b"".join(audio_generator)
 
-            # consume generator
-            audio_data = b"".join(audio_generator)
+        try:
+            # The SDK client is synchronous; run the request off the event loop
+            audio_data = await asyncio.to_thread(generate)
 
             # Save to cache
             self.cache.set(text, voice_id, options, audio_data)
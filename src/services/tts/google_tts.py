@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import os
+from collections.abc import Mapping
 from typing import Any
 
 from google.cloud import texttospeech
@@ -44,7 +46,7 @@ class GoogleTTSProvider(TTSProvider):
             return False
 
     async def synthesize(
-        self, text: str, voice_id: str, options: dict[str, Any] | None = None
+        self, text: str, voice_id: str, options: Mapping[str, Any] | None = None
     ) -> bytes:
         if not self.client:
             raise RuntimeError("Google TTS client is not initialized.")
@@ -105,8 +107,11 @@ class GoogleTTSProvider(TTSProvider):
         self.logger.info(f"Synthesizing with Google TTS: {voice_id}")
 
         try:
-            response = self.client.synthesize_speech(
-                input=synthesis_input, voice=voice_params, audio_config=audio_config
+            response = await asyncio.to_thread(
+                self.client.synthesize_speech,
+                input=synthesis_input,
+                voice=voice_params,
+                audio_config=audio_config,
             )
 
             # Save to cache
@@ -205,6 +205,10 @@ class VoiceKitService:
             ),
         ]
 
+        # Index kits and voices by ID for direct lookups
+        self._kits_by_id = {kit.id: kit for kit in self._kits}
+        self._voices_by_id = {voice.id: voice for kit in self._kits for voice in kit.voices}
+
     async def list_kits(self) -> list[VoiceKit]:
         """List all available voice kits."""
         return self._kits
@@ -219,10 +223,7 @@ class VoiceKitService:
 
     async def get_kit(self, kit_id: str) -> VoiceKit | None:
         """Get a specific kit by ID."""
-        for kit in self._kits:
-            if kit.id == kit_id:
-                return kit
-        return None
+        return self._kits_by_id.get(kit_id)
 
     async def download_kit(self, kit_id: str) -> VoiceKit | None:
         """Simulate downloading a kit."""
@@ -245,11 +246,7 @@ class VoiceKitService:
         # We search ALL kits, but maybe should only allow if downloaded?
         # For now, let's search all to allow "previewing" uninstalled voices via Store?
         # Actually, usually you can preview before download.
-        for kit in self._kits:
-            for voice in kit.voices:
-                if voice.id == voice_id:
-                    return voice
-        return None
+        return self._voices_by_id.get(voice_id)
 
     async def get_voice_preview(self, voice_id: str, text: str | None = None) -> bytes:
         """Get audio preview for a voice."""
@@ -260,7 +257,7 @@ class VoiceKitService:
         preview_text = text or voice.preview_text or "你好，這是聲音預覽。"
 
         # Find kit to determine provider
-        kit = next((k for k in self._kits if k.id == voice.kit_id), None)
+        kit = self._kits_by_id.get(voice.kit_id)
         if not kit:
             raise ValueError(f"Kit not found for voice: {voice_id}")
 
@@ -309,7 +306,7 @@ class VoiceKitService:
         # kit = next(k for k in self._kits if k.id == voice.kit_id)
         # if not kit.is_downloaded: raise ValueError("Kit not downloaded")
 
-        kit = next((k for k in self._kits if k.id == voice.kit_id), None)
+        kit = self._kits_by_id.get(voice.kit_id)
         if not kit:
             raise ValueError(f"Kit not found for voice: {voice_id}")
 
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def run_isolated(code: str) -> str:
+    """Run code in a fresh interpreter so sys.modules starts empty."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PROJECT_ROOT,
+    )
+    return result.stdout.strip()
+
+
+def test_qa_handler_import_does_not_load_anthropic():
+    """Test importing a sibling service does not pull in the Anthropic SDK."""
+    output = run_isolated("import sys, src.services.qa_handler; print('anthropic' in sys.modules)")
+
+    assert output == "False"
+
+
+def test_claude_service_resolved_on_first_access():
+    """Test the lazy package attribute resolves to the llm module's class."""
+    output = run_isolated(
+        "from src.services import ClaudeService; from src.services import llm; "
+        "print(ClaudeService is llm.ClaudeService)"
+    )
+
+    assert output == "True"
@@ -0,0 +1,151 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import anthropic
+import pytest
+
+from src.services.llm import ClaudeService, _ResponseCache
+
+
+def make_service(response_text: str) -> ClaudeService:
+    """Create a ClaudeService whose client returns the given text.
+
+    Must be called from the event loop the test runs on.
+    """
+    service = ClaudeService()
+    block = MagicMock()
+    block.text = response_text
+    service._client = MagicMock()
+    service._client.is_closed.return_value = False
+    service._client.messages.create = AsyncMock(return_value=MagicMock(content=[block]))
+    service._client_loop = asyncio.get_running_loop()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_generate_story_parses_fenced_json():
+    """Test story JSON wrapped in a markdown code fence is parsed."""
+    service = make_service('```json\n{"title": "小兔子", "content": "從前從前"}\n```')
+
+    result = await service.generate_story(["兔子"])
+
+    assert result.title == "小兔子"
+    assert result.content == "從前從前"
+
+
+@pytest.mark.asyncio
+async def test_generate_story_falls_back_to_raw_text():
+    """Test non-JSON output is used as the story content."""
+    service = make_service("從前從前，有一隻小兔子。")
+
+    result = await service.generate_story(["兔子"])
+
+    assert result.title == "故事：兔子"
+    assert result.content == "從前從前，有一隻小兔子。"
+
+
+@pytest.mark.asyncio
+async def test_answer_question_parses_unfenced_json():
+    """Test Q&A JSON without a code fence is parsed."""
+    service = make_service('{"answer": "因為他很勇敢", "is_in_scope": false}')
+
+    result = await service.answer_question("故事內容", "為什麼？")
+
+    assert result.answer == "因為他很勇敢"
+    assert result.is_in_scope is False
+
+
+@pytest.mark.asyncio
+async def test_generate_story_cached_by_keywords():
+    """Test repeated keyword lists are served from the cache, keeping their order."""
+    service = make_service('{"title": "龍和公主", "content": "從前從前"}')
+
+    first = await service.generate_story(["龍", "公主"])
+    second = await service.generate_story(["龍", "公主"])
+    await service.generate_story(["公主", "龍"])
+
+    assert second is first
+    assert service._client.messages.create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_answer_question_cached_per_story_and_question():
+    """Test repeated questions about the same story are served from the cache."""
+    service = make_service('{"answer": "因為他很勇敢", "is_in_scope": true}')
+
+    first = await service.answer_question("故事內容", "為什麼？")
+    second = await service.answer_question("故事內容", " 為什麼？ ")
+    await service.answer_question("另一個故事", "為什麼？")
+
+    assert second is first
+    assert service._client.messages.create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_api_errors_are_not_cached():
+    """Test failed calls are retried against the API instead of cached."""
+    service = make_service("")
+    service._client.messages.create = AsyncMock(
+        side_effect=anthropic.APIError("boom", request=MagicMock(), body=None)
+    )
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="Failed to answer question"):
+            await service.answer_question("故事內容", "為什麼？")
+
+    assert service._client.messages.create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_non_json_replies_are_not_cached():
+    """Test raw-text fallbacks are not cached so the next call can retry."""
+    service = make_service("從前從前，有一隻小兔子。")
+
+    for _ in range(2):
+        await service.generate_story(["兔子"])
+        await service.answer_question("故事內容", "為什麼？")
+
+    assert service._client.messages.create.await_count == 4
+
+
+def test_client_rebuilt_for_new_event_loop():
+    """Test that a client bound to a finished event loop is not reused."""
+    service = ClaudeService()
+    service.api_key = "test-key"
+
+    async def get_client():
+        return service.client, service.client
+
+    first, same = asyncio.run(get_client())
+    second, _ = asyncio.run(get_client())
+
+    assert first is same
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_client():
+    """Test aclose closes and drops the pooled client."""
+    service = make_service("")
+    client = service._client
+    client.close = AsyncMock()
+
+    await service.aclose()
+
+    client.close.assert_awaited_once()
+    assert service._client is None
+
+
+def test_response_cache_evicts_least_recently_used():
+    """Test the response cache stays bounded and keeps recently used entries."""
+    cache: _ResponseCache[str, int] = _ResponseCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from src.services.qa_handler import QAHandlerService
+
+
+@pytest.fixture
+def service():
+    return QAHandlerService(api_key="test-key")
+
+
+async def test_client_reused_within_event_loop(service):
+    """Test that calls on the same event loop share one pooled client."""
+    assert service.client is service.client
+    await service.aclose()
+
+
+async def test_aclose_closes_client(service):
+    """Test aclose closes and drops the pooled client."""
+    client = service.client
+
+    await service.aclose()
+
+    assert client.is_closed
+    assert service.client is not client
+    await service.aclose()
+
+
+def test_client_rebuilt_for_new_event_loop(service):
+    """Test that a client bound to a finished event loop is not reused."""
+
+    async def get_client():
+        return service.client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from src.services.story_generator import UNSAFE_KEYWORDS, StoryGeneratorService
+
+
+@pytest.fixture
+def service():
+    return StoryGeneratorService(api_key="test-key")
+
+
+def test_safe_content_passes(service):
+    """Test that ordinary story text is accepted."""
+    assert service.validate_content_safety("小兔子和好朋友一起去森林裡野餐。")
+
+
+@pytest.mark.parametrize("keyword", UNSAFE_KEYWORDS)
+def test_unsafe_keyword_rejected(service, keyword):
+    """Test that every unsafe keyword is detected anywhere in the content."""
+    assert not service.validate_content_safety(f"從前從前，{keyword}出現了。")
+
+
+def test_empty_content_passes(service):
+    """Test that empty content has no unsafe keywords."""
+    assert service.validate_content_safety("")
+
+
+async def test_client_reused_within_event_loop(service):
+    """Test that calls on the same event loop share one pooled client."""
+    assert service.client is service.client
+    await service.aclose()
+
+
+async def test_aclose_closes_client(service):
+    """Test aclose closes and drops the pooled client."""
+    client = service.client
+
+    await service.aclose()
+
+    assert client.is_closed
+    assert service.client is not client
+    await service.aclose()
+
+
+def test_client_rebuilt_for_new_event_loop(service):
+    """Test that a client bound to a finished event loop is not reused."""
+
+    async def get_client():
+        return service.client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
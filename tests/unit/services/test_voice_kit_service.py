@@ -1,6 +1,7 @@
 import pytest
 
-# Will import VoiceKitService once created
+from src.models.voice import AgeGroup, Gender, VoiceCharacter, VoiceStyle
+from src.services.voice_kit_service import VoiceKitService
 
 
 @pytest.mark.asyncio
@@ -17,3 +18,38 @@ class TestVoiceKitService:
     async def test_get_voice_not_found(self):
         """Test getting non-existent voice raises error."""
         pass
+
+    async def test_get_voice_by_id(self):
+        """Test voices are found by ID across all kits."""
+        service = VoiceKitService()
+
+        for kit in await service.list_kits():
+            for voice in kit.voices:
+                assert await service.get_voice(voice.id) is voice
+
+        assert await service.get_voice("missing-voice") is None
+
+    async def test_get_kit_by_id(self):
+        """Test kits are found by ID."""
+        service = VoiceKitService()
+
+        for kit in await service.list_kits():
+            assert await service.get_kit(kit.id) is kit
+
+        assert await service.get_kit("missing-kit") is None
+
+
+def test_ssml_options_keep_unknown_keys():
+    """Test provider options not declared on SSMLOptions are passed through."""
+    voice = VoiceCharacter(
+        id="test-voice",
+        kit_id="test-kit",
+        name="Test",
+        provider_voice_id="zh-TW-HsiaoChenNeural",
+        ssml_options={"role": "Girl", "style_degree": 1.5},
+        gender=Gender.FEMALE,
+        age_group=AgeGroup.CHILD,
+        style=VoiceStyle.CHARACTER,
+    )
+
+    assert voice.ssml_options == {"role": "Girl", "style_degree": 1.5}
@@ -0,0 +1,38 @@
+import json
+import logging
+
+import pytest
+
+from src.main import JSONFormatter
+
+
+def make_record(message: str, **extra: object) -> logging.LogRecord:
+    """Create a storybuddy log record with optional extra fields."""
+    record = logging.LogRecord("storybuddy", logging.INFO, __file__, 1, message, None, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_json_formatter_writes_utf8_unescaped():
+    """Test the orjson path keeps non-ASCII text as UTF-8."""
+    output = JSONFormatter().format(make_record("小兔子問了問題", request_id="abc"))
+
+    assert "小兔子問了問題" in output
+    assert json.loads(output)["request_id"] == "abc"
+
+
+@pytest.mark.parametrize(
+    ("message", "extra", "field", "expected"),
+    [
+        ("問題：\ud83d", {}, "message", "問題：\ud83d"),
+        ("Request completed", {"duration_ms": 2**64}, "duration_ms", 2**64),
+    ],
+    ids=["lone-surrogate", "oversized-int"],
+)
+def test_json_formatter_falls_back_for_orjson_rejects(message, extra, field, expected):
+    """Test records orjson cannot encode are still serialized by json."""
+    output = JSONFormatter().format(make_record(message, **extra))
+
+    assert output.isascii()
+    assert json.loads(output)[field] == expected